@@ -13,13 +13,18 @@ If there are any issues please contact:
 
 import os
 import sys
+import threading
+import time
 import urllib.request
-import tempfile
+import maya.cmds as cmds
 
 # Update the following variables with your GitHub information:
 repository_url = "https://github.com/Atsantiago/NMSU_Scripts"
 script_path = "cmi_modeling_checklist.py"
 
+# Seconds a downloaded checklist is reused before GitHub is asked again
+checklist_source_max_age = 60
+
 # Check the Maya Python version
 if sys.version_info.major == 2:
     # Python 2
@@ -28,21 +33,55 @@ else:
     # Python 3
     exec_function = exec
 
-# Create a temporary directory to download the script
-temp_dir = tempfile.mkdtemp()
+# Downloaded Checklist (Kept in Maya's global namespace, so it survives between clicks on the shelf button)
+checklist_source_cache = globals().setdefault("checklist_source_cache", {"contents": None, "time": 0, "is_refreshing": False})
+
+# Last Downloaded Checklist on Disk (Used when GitHub can't be reached at the start of a session)
+checklist_saved_file = os.path.join(cmds.internalVar(userAppDir=True), "FDMA2530_cmi_modeling_checklist.py")
 
-# Download the script from GitHub
 script_url = f"{repository_url}/raw/master/{script_path}"
-script_file = os.path.join(temp_dir, os.path.basename(script_path))
 
-urllib.request.urlretrieve(script_url, script_file)
+# Download the script from GitHub
+def download_checklist_source():
+    with urllib.request.urlopen(script_url) as response:
+        contents = response.read().decode("utf-8")
+    checklist_source_cache["contents"] = contents
+    checklist_source_cache["time"] = time.time()
+    try:
+        with open(checklist_saved_file, "w", encoding="utf-8") as file:
+            file.write(contents)
+    except OSError:
+        pass # The saved copy is only a fallback, the downloaded one can still run
 
-# Source the script in Maya
-maya_script_path = os.path.join(temp_dir, "cmi_modeling_checklist.py")
+# Load the copy saved by a previous session
+def load_saved_checklist_source():
+    with open(checklist_saved_file, "r", encoding="utf-8") as file:
+        checklist_source_cache["contents"] = file.read()
+    checklist_source_cache["time"] = 0 # Treated as old, so the next click tries GitHub again in the background
 
-if os.path.isfile(maya_script_path):
-    with open(maya_script_path, "r") as file:
-        script_contents = file.read()
-        exec_function(script_contents, globals())
-else:
-    print(f"Failed to locate the script: {maya_script_path}")
+# Download in the background (The copy in the cache keeps being used until this finishes)
+def refresh_checklist_source():
+    try:
+        download_checklist_source()
+    except OSError:
+        pass # Offline or GitHub unavailable, the next click will try again
+    finally:
+        checklist_source_cache["is_refreshing"] = False
+
+if checklist_source_cache["contents"] is None:
+    # First click of the session, nothing to run until the download finishes
+    try:
+        download_checklist_source()
+    except OSError:
+        if not os.path.isfile(checklist_saved_file):
+            raise
+        load_saved_checklist_source()
+        print(f"Unable to download the checklist from GitHub. Using the last downloaded copy: {checklist_saved_file}")
+elif time.time() - checklist_source_cache["time"] > checklist_source_max_age and not checklist_source_cache.get("is_refreshing"):
+    # Old copy, run it now and get the latest version ready for the next click
+    checklist_source_cache["is_refreshing"] = True
+    threading.Thread(target=refresh_checklist_source, daemon=True).start()
+
+# Source the script in Maya
+script_contents = checklist_source_cache["contents"]
+exec_function(script_contents, globals())
@@ -29,7 +29,10 @@ The UI and a majority of the code used for this script was repourposed from a pr
 
 import maya.cmds as cmds
 import maya.mel as mel
+import maya.app.general.fileTexturePathResolver
 import copy
+import subprocess
+import sys
 from maya import OpenMayaUI as omui
 
 try:
@@ -43,6 +46,11 @@ try:
 except ImportError:
     from PySide.QtGui import QIcon, QWidget
 
+try:
+    from concurrent.futures import ThreadPoolExecutor
+except ImportError:
+    ThreadPoolExecutor = None # Python 2 (Maya 2020 and older)
+
 
 # Checklist Name
 script_name = "CMI Modeling Checklist" 
@@ -53,6 +61,14 @@ script_version = "2.0"
 # Python Version
 python_version = sys.version_info.major
 
+# Report Viewer (Picked once when the script loads instead of on every report)
+if sys.platform == "win32":
+    report_viewer_command = ["notepad"]
+elif sys.platform == "darwin":
+    report_viewer_command = ["open", "-t"]
+else:
+    report_viewer_command = ["xdg-open"]
+
 # Status Colors
 def_color = 0.3, 0.3, 0.3
 pass_color = (0.17, 1.0, 0.17)
@@ -60,6 +76,21 @@ warning_color = (1.0, 1.0, 0.17)
 error_color = (1.0, 0.17, 0.17)
 exception_color = 0.2, 0.2, 0.2
 
+# UI Colors (Shared by the main and help windows instead of rebuilt for every element)
+title_color = (0.4, 0.4, 0.4)
+consider_color = (0.5, 0.5, 0.0)
+help_title_color = (0.0, 0.5, 0.0)
+link_color = (1.0, 1.0, 1.0)
+
+# UI Layouts (Row settings repeated across the main and help windows)
+single_column_layout = { "nc" : 1, "cw" : [(1, 300)], "cs" : [(1, 10)] }
+help_footer_layout = { "nc" : 2, "cw" : [(1, 140), (2, 140)], "cs" : [(1, 10), (2, 0)] }
+
+# Report Section Layout (Used by every check to format its section of the full report)
+report_header = script_name + " Full Report:\n"
+report_section_template = '\n*** {} ***\n{}'
+report_section_separator = "\n\n"
+
 # Checklist Items - Item Number [Name, Expected Value]
 checklist_items = { #0 Removed
                     1 : ["Scene Units", "cm"],
@@ -85,6 +116,23 @@ checklist_items = { #0 Removed
                    #21 Removed
                   }
 
+# Checklist Item IDs - Item Number : UI Element ID (Built once, names don't change after load)
+checklist_item_ids = {item : checklist_items.get(item)[0].lower().replace(" ","_").replace("-","_") for item in checklist_items}
+
+# Last Label Shown by Each "output_" Text (Avoids editing the UI when nothing changed)
+checklist_output_labels = {}
+
+# Scene Query Cache (Only used while a Refresh or Report is running, see list_scene_nodes)
+checklist_scene_cache = { "is_active" : False,
+                          "nodes" : {}
+                        }
+
+# Report File Location (Resolved on the first export, Maya's temp folder doesn't move during a session)
+checklist_report_file = { "path" : None }
+
+# Help Text (Assembled on the first help window, the checklist items it describes don't change after load)
+checklist_help_text = { "text" : None }
+
 # Store Default Values for Reseting
 settings_default_checklist_values = copy.deepcopy(checklist_items)
 
@@ -116,11 +164,11 @@ def build_gui_ats_cmi_modeling_checklist():
     cmds.separator(h=14, style='none') # Empty Space
     cmds.rowColumnLayout(nc=3, cw=[(1, 10), (2, 240), (3, 50)], cs=[(1, 10), (2, 0), (3, 0)], p=main_column)
 
-    cmds.text(" ", bgc=[.4,.4,.4])
-    cmds.text(script_name, bgc=[0.4,0.4,0.4],  fn="boldLabelFont", align="left")
-    cmds.button( l ="Help", bgc=(0.4, 0.4, 0.4), c=lambda x:build_gui_help_ats_cmi_modeling_checklist())
+    cmds.text(" ", bgc=title_color)
+    cmds.text(script_name, bgc=title_color,  fn="boldLabelFont", align="left")
+    cmds.button( l ="Help", bgc=title_color, c=lambda x:build_gui_help_ats_cmi_modeling_checklist())
     cmds.separator(h=10, style='none', p=main_column) # Empty Space
-    cmds.rowColumnLayout(nc=1, cw=[(1, 300)], cs=[(1,10)], p=main_column) # For the separator
+    cmds.rowColumnLayout(p=main_column, **single_column_layout) # For the separator
     cmds.separator(h=8)
     cmds.separator(h=5, style='none') # Empty Space
     
@@ -152,20 +200,21 @@ def build_gui_ats_cmi_modeling_checklist():
     # Build Checklist 
     def create_checklist_items(items):
         for item in items:
-            item_id = checklist_items.get(item)[0].lower().replace(" ","_").replace("-","_")
+            item_id = checklist_item_ids.get(item)
             cmds.text(l=checklist_items.get(item)[0] + ': ', align="left")
             cmds.button("status_" + item_id , l='', h=14, bgc=def_color)
             cmds.text("output_" + item_id, l='...', align="center")
 
+    checklist_output_labels.clear() # New text elements start as "..."
     create_checklist_items(checklist_items)
 
-    cmds.rowColumnLayout(nc=1, cw=[(1, 300)], cs=[(1,10)], p=main_column) # For the separator
+    cmds.rowColumnLayout(p=main_column, **single_column_layout) # For the separator
     cmds.separator(h=8, style='none') # Empty Space
     cmds.separator(h=8)
     
 
     # Checklist Buttons ==========================================================
-    checklist_buttons = cmds.rowColumnLayout(nc=1, cw=[(1, 300)], cs=[(1,10)], p=main_column)
+    checklist_buttons = cmds.rowColumnLayout(p=main_column, **single_column_layout)
     cmds.separator(h=10, style='none')
     cmds.button(l='Generate Report', h=30, c=lambda args: checklist_generate_report())
     cmds.separator(h=10, style='none')
@@ -175,18 +224,18 @@ def build_gui_ats_cmi_modeling_checklist():
 
     # Consider Before Submitting ================================================
     cmds.separator(h=7, style='none') # Empty Space
-    cmds.text(l="Things to Consider Before Submitting", bgc=[.5,.5,.0],  fn="boldLabelFont", align="center")
-    cmds.separator(h=7, style='none') # Empty Space
-    cmds.text(l="Topology:", fn="boldLabelFont", align="left")
-    cmds.text(l='1. Is it clean?\n2.Does it have a flow and have a good structure?\n3. Does it follow the guidelines we learned? Does it make sense?\n4. Do you have any ngons? Are triangles causing artifacting?\n', align="left")
-    cmds.separator(h=7, style='none') # Empty Space
-    cmds.text(l="Project", fn="boldLabelFont", align="left")
-    cmds.text(l='1.Have you addressed all the notes from feedback?\n2. Is the project organized?\n3. Have you named everything correctly?\n4. Can another person open my project and easily\n   navigate through it?\n', align="left")
-
-    # Disclaimer ================================================
-    cmds.separator(h=7, style='none') # Empty Space
-    cmds.text(l="Disclaimer:", fn="boldLabelFont", align="left")
-    cmds.text(l='Even if this script shows no errors, it does not necesarrily\nreflect your final grade.\nThis script is just a tool to help you check for some common\nissues.\nVerify instructions and deliverables on Canvas\nor with your instructor.', align="left")
+    cmds.text(l="Things to Consider Before Submitting", bgc=consider_color,  fn="boldLabelFont", align="center")
+    
+    # Notes - [Title, Text] (The disclaimer goes last, right before the window is locked)
+    checklist_notes = [ ["Topology:", '1. Is it clean?\n2.Does it have a flow and have a good structure?\n3. Does it follow the guidelines we learned? Does it make sense?\n4. Do you have any ngons? Are triangles causing artifacting?\n'],
+                        ["Project", '1.Have you addressed all the notes from feedback?\n2. Is the project organized?\n3. Have you named everything correctly?\n4. Can another person open my project and easily\n   navigate through it?\n'],
+                        ["Disclaimer:", 'Even if this script shows no errors, it does not necesarrily\nreflect your final grade.\nThis script is just a tool to help you check for some common\nissues.\nVerify instructions and deliverables on Canvas\nor with your instructor.']
+                      ]
+    
+    for note_title, note_text in checklist_notes:
+        cmds.separator(h=7, style='none') # Empty Space
+        cmds.text(l=note_title, fn="boldLabelFont", align="left")
+        cmds.text(l=note_text, align="left")
 
     # Lock Window
     cmds.showWindow(window_name)
@@ -210,98 +259,77 @@ def checklist_refresh():
     # Save Current Selection For Later
     current_selection = cmds.ls(selection=True)
     
-    #Removed
-    check_scene_units()
-    check_output_resolution()
-    check_total_texture_count()
-    check_network_file_paths()
-    #Removed
-    check_unparented_objects()  
-    check_total_triangle_count()
-    check_total_poly_object_count()
-    #Removed
-    #Removed - Initial:check_rs_shadow_casting_light_count()
-    #Removed
-    check_default_object_names()
-    check_objects_assigned_to_lambert1()
-    check_ngons()
-    check_non_manifold_geometry()
-    #Removed
-    check_frozen_transforms()
-    check_animated_visibility()
-    check_non_deformer_history()
-    check_textures_color_space()
-    #Removed
-    
-    # Clear Selection
-    cmds.selectMode( object=True )
-    cmds.select(clear=True)
-    
-    # Reselect Previous Selection
-    cmds.select(current_selection)
+    # Run Checks as a Single Undo Step Without Redrawing After Each One
+    cmds.undoInfo(openChunk=True, chunkName="cmi_modeling_checklist_refresh")
+    cmds.refresh(suspend=True)
+    checklist_scene_cache["is_active"] = True
+    try:
+        for check_function in checklist_functions:
+            check_function()
+        
+        # Clear Selection
+        cmds.selectMode( object=True )
+        cmds.select(clear=True)
+        
+        # Reselect Previous Selection
+        cmds.select(current_selection)
+    finally:
+        checklist_scene_cache["is_active"] = False
+        checklist_scene_cache.get("nodes").clear()
+        cmds.refresh(suspend=False)
+        cmds.undoInfo(closeChunk=True)
     
 
 def checklist_generate_report():
     # Save Current Selection For Later
     current_selection = cmds.ls(selection=True)
     
-    report_strings = []
-    #Removed
-    report_strings.append(check_scene_units())
-    report_strings.append(check_output_resolution())
-    report_strings.append(check_total_texture_count())
-    report_strings.append(check_network_file_paths())
-    #Removed
-    report_strings.append(check_unparented_objects())
-    report_strings.append(check_total_triangle_count())
-    report_strings.append(check_total_poly_object_count())
-    #Removed
-    #Removed - Initial: report_strings.append(check_rs_shadow_casting_light_count())
-    #Removed
-    report_strings.append(check_default_object_names())
-    report_strings.append(check_objects_assigned_to_lambert1())
-    report_strings.append(check_ngons())
-    report_strings.append(check_non_manifold_geometry())
-    #Removed
-    report_strings.append(check_frozen_transforms())
-    report_strings.append(check_animated_visibility())
-    report_strings.append(check_non_deformer_history())
-    report_strings.append(check_textures_color_space())
-    #Removed
-    
-    # Clear Selection
-    cmds.selectMode( object=True )
-    cmds.select(clear=True)
+    # Run Checks as a Single Undo Step Without Redrawing After Each One
+    cmds.undoInfo(openChunk=True, chunkName="cmi_modeling_checklist_report")
+    cmds.refresh(suspend=True)
+    checklist_scene_cache["is_active"] = True
+    try:
+        report_strings = [check_function() for check_function in checklist_functions]
+        
+        # Clear Selection
+        cmds.selectMode( object=True )
+        cmds.select(clear=True)
+        
+        # Reselect Previous Selection
+        cmds.select(current_selection)
+    finally:
+        checklist_scene_cache["is_active"] = False
+        checklist_scene_cache.get("nodes").clear()
+        cmds.refresh(suspend=False)
+        cmds.undoInfo(closeChunk=True)
     
     # Show Report
     export_report_to_txt(report_strings)
     
-    # Reselect Previous Selection
-    cmds.select(current_selection)
-    
 
     
 # Creates Help GUI
 def build_gui_help_ats_cmi_modeling_checklist():
     window_name = "build_gui_help_ats_cmi_modeling_checklist"
     if cmds.window(window_name, exists=True):
-        cmds.deleteUI(window_name, window=True)
+        cmds.showWindow(window_name) # Help content doesn't change, bring the open window forward instead of rebuilding it
+        return
 
     cmds.window(window_name, title= script_name + " Help", mnb=False, mxb=False, s=True)
-    cmds.window(window_name, e=True, s=True, wh=[1,1])
+    cmds.window(window_name, e=True, wh=[1,1])
 
     cmds.columnLayout("main_column", p= window_name)
    
     # Title Text
     cmds.separator(h=12, style='none') # Empty Space
     cmds.rowColumnLayout(nc=1, cw=[(1, 310)], cs=[(1, 10)], p="main_column") # Window Size Adjustment
-    cmds.rowColumnLayout(nc=1, cw=[(1, 300)], cs=[(1, 10)], p="main_column") # Title Column
-    cmds.text(script_name + " Help", bgc=[0,.5,0],  fn="boldLabelFont", align="center")
+    cmds.rowColumnLayout(p="main_column", **single_column_layout) # Title Column
+    cmds.text(script_name + " Help", bgc=help_title_color,  fn="boldLabelFont", align="center")
     cmds.separator(h=10, style='none', p="main_column") # Empty Space
 
     # Body ====================
     checklist_spacing = 4
-    cmds.rowColumnLayout(nc=1, cw=[(1, 300)], cs=[(1,10)], p="main_column")
+    cmds.rowColumnLayout(p="main_column", **single_column_layout)
     cmds.text(l='This script performs a series of checks to detect common', align="left")
     cmds.text(l='issues that are often accidently ignored/unnoticed for', align="left")
     cmds.text(l='the FDMA 2530: Intro to Modeling.', align="left")
@@ -312,73 +340,70 @@ def build_gui_help_ats_cmi_modeling_checklist():
     cmds.separator(h=5, style='none') # Empty Space
     
     cmds.rowColumnLayout(nc=2, cw=[(1, 35),(2, 265)], cs=[(1, 10),(2, 10)], p="main_column")
-    cmds.button(l='', h=14, bgc=def_color, c=lambda args: print_message('Default color, means that it was not yet tested.', as_heads_up_message=True))
-    cmds.text(l='- Default color, not yet tested.', align="left", fn="smallPlainLabelFont") 
-    
-    cmds.button(l='', h=14, bgc=pass_color, c=lambda args: print_message('Pass color, means that no issues were found.', as_heads_up_message=True))
-    cmds.text(l='- Pass color, no issues were found.', align="left", fn="smallPlainLabelFont") 
-    
-    cmds.button(l='', h=14, bgc=warning_color, c=lambda args: print_message('Warning color, some possible issues were found', as_heads_up_message=True))
-    cmds.text(l='- Warning color, some possible issues were found', align="left", fn="smallPlainLabelFont") 
-    
-    cmds.button(l='', h=14, bgc=error_color, c=lambda args: print_message('Error color, means that some possible issues were found', as_heads_up_message=True))
-    cmds.text(l='- Error color, issues were found.', align="left", fn="smallPlainLabelFont") 
-    
-    cmds.button(l='', h=14, bgc=exception_color, c=lambda args: print_message('Exception color, an issue caused the check to fail. Likely because of a missing plug-in or unexpected value', as_heads_up_message=True))
-    cmds.text(l='- Exception color, an issue caused the check to fail.', align="left", fn="smallPlainLabelFont") 
-    
-    cmds.button(l='?', h=14, bgc=def_color, c=lambda args: print_message('Question mask, click on button for more help. It often gives you extra options regarding the found issues.', as_heads_up_message=True))
-    cmds.text(l='- Question mask, click on button for more help.', align="left", fn="smallPlainLabelFont") 
+    # Status Legend - [Button Label, Color, Message, Description]
+    status_legend = [ ['', def_color, 'Default color, means that it was not yet tested.', '- Default color, not yet tested.'],
+                      ['', pass_color, 'Pass color, means that no issues were found.', '- Pass color, no issues were found.'],
+                      ['', warning_color, 'Warning color, some possible issues were found', '- Warning color, some possible issues were found'],
+                      ['', error_color, 'Error color, means that some possible issues were found', '- Error color, issues were found.'],
+                      ['', exception_color, 'Exception color, an issue caused the check to fail. Likely because of a missing plug-in or unexpected value', '- Exception color, an issue caused the check to fail.'],
+                      ['?', def_color, 'Question mask, click on button for more help. It often gives you extra options regarding the found issues.', '- Question mask, click on button for more help.']
+                    ]
+    
+    for button_label, button_color, message, description in status_legend:
+        cmds.button(l=button_label, h=14, bgc=button_color, c=lambda args, message=message: print_message(message, as_heads_up_message=True))
+        cmds.text(l=description, align="left", fn="smallPlainLabelFont") 
     
     cmds.separator(h=15, style='none') # Empty Space
 
     # Checklist Items =============
-    cmds.rowColumnLayout(nc=1, cw=[(1, 300)], cs=[(1, 10)], p="main_column")
+    cmds.rowColumnLayout(p="main_column", **single_column_layout)
     cmds.text(l='Checklist Items and Guidelines:', align="left", fn="boldLabelFont") 
     cmds.separator(h=checklist_spacing, style='none') # Empty Space
    
-    # Create Help List: 
-    font_size ='smallPlainLabelFont'
-    items_for_settings = [0, 1, 2, 3, 4, 5, 7, 8, 9, 10, 11] # Allow user to update expected values
-    items_with_warnings = [3, 7, 8, 9, 10, 11] # Allow users to update warning values too
-    
-    checklist_items_help_scroll_field = cmds.scrollField(editable=False, wordWrap=True, fn="smallPlainLabelFont")
+    # Create Help List: (Assembled once per session and sent to the scroll field in one command)
+    help_text = checklist_help_text.get("text")
+    if help_text is None:
+        help_lines = []
  
-    cmds.scrollField(checklist_items_help_scroll_field, e=True, ip=0, it='[X] ' + checklist_items.get(1)[0] +': returns error if not matching: "' + str(checklist_items.get(1)[1]) + '".\n\n')
+        help_lines.append('[X] ' + checklist_items.get(1)[0] +': returns error if not matching: "' + str(checklist_items.get(1)[1]) + '".\n\n')
 
-    cmds.scrollField(checklist_items_help_scroll_field, e=True, ip=0, it='[X] ' + checklist_items.get(2)[0] +': returns error if none of the values match:\n    ' + str(checklist_items.get(2)[1])+ '. For more information check the guidelines for\n    this assignment. It expects your height or width to match\n    the expected value, so check your render settings are set to \n HD720. \n\n')
+        help_lines.append('[X] ' + checklist_items.get(2)[0] +': returns error if none of the values match:\n    ' + str(checklist_items.get(2)[1])+ '. For more information check the guidelines for\n    this assignment. It expects your height or width to match\n    the expected value, so check your render settings are set to \n HD720. \n\n')
 
-    cmds.scrollField(checklist_items_help_scroll_field, e=True, ip=0, it='[X] ' + checklist_items.get(3)[0] +': error if more than ' + str(checklist_items.get(3)[1][1]) +  '\n     warning if more than ' + str(checklist_items.get(3)[1][0])+ '.\n\n')
+        help_lines.append('[X] ' + checklist_items.get(3)[0] +': error if more than ' + str(checklist_items.get(3)[1][1]) +  '\n     warning if more than ' + str(checklist_items.get(3)[1][0])+ '.\n\n')
 
-    cmds.scrollField(checklist_items_help_scroll_field, e=True, ip=0, it='[X] ' + checklist_items.get(4)[0] +': must contain ' + str(checklist_items.get(4)[1])+ ' in its path.\n     This is to make sure a Maya project is being used.\n\n')
+        help_lines.append('[X] ' + checklist_items.get(4)[0] +': must contain ' + str(checklist_items.get(4)[1])+ ' in its path.\n     This is to make sure a Maya project is being used.\n\n')
  
-    cmds.scrollField(checklist_items_help_scroll_field, e=True, ip=0, it='[X] ' + checklist_items.get(6)[0] +': returns error if common objects are\n     found outside hierarchies' + '\n\n')
+        help_lines.append('[X] ' + checklist_items.get(6)[0] +': returns error if common objects are\n     found outside hierarchies' + '\n\n')
 
-    cmds.scrollField(checklist_items_help_scroll_field, e=True, ip=0, it='[X] ' + checklist_items.get(7)[0] +': : error if more than ' + str(checklist_items.get(7)[1][1]) + '\n     warning if more than: ' + str(checklist_items.get(7)[1][0]) + '.' + '\n\n')
+        help_lines.append('[X] ' + checklist_items.get(7)[0] +': : error if more than ' + str(checklist_items.get(7)[1][1]) + '\n     warning if more than: ' + str(checklist_items.get(7)[1][0]) + '.' + '\n\n')
 
-    cmds.scrollField(checklist_items_help_scroll_field, e=True, ip=0, it='[X] ' + checklist_items.get(8)[0] +': error if more than ' + str(checklist_items.get(8)[1][1])  + '\n     warning if more than ' + str(checklist_items.get(8)[1][0]) + '\n\n')   
+        help_lines.append('[X] ' + checklist_items.get(8)[0] +': error if more than ' + str(checklist_items.get(8)[1][1])  + '\n     warning if more than ' + str(checklist_items.get(8)[1][0]) + '\n\n')
 
 
-    cmds.scrollField(checklist_items_help_scroll_field, e=True, ip=0, it='[X] ' + checklist_items.get(12)[0] +': error if using default names.' + '\n  warning if containing default names.\n    Examples of default names:\n      "pCube1" = Error\n      "pointLight1" = Error\n      "nurbsPlane1" = Error\n      "my_pCube" = Warning\n\n')  
+        help_lines.append('[X] ' + checklist_items.get(12)[0] +': error if using default names.' + '\n  warning if containing default names.\n    Examples of default names:\n      "pCube1" = Error\n      "pointLight1" = Error\n      "nurbsPlane1" = Error\n      "my_pCube" = Warning\n\n')
 
-    cmds.scrollField(checklist_items_help_scroll_field, e=True, ip=0, it='[X] ' + checklist_items.get(13)[0] +': error if anything is assigned.\n\n') 
+        help_lines.append('[X] ' + checklist_items.get(13)[0] +': error if anything is assigned.\n\n')
         
-    cmds.scrollField(checklist_items_help_scroll_field, e=True, ip=0, it='[X] ' + checklist_items.get(14)[0] +': error if any ngons found.\n     A polygon that is made up of five or more vertices. \n     Anything over a quad (4 sides) is considered an ngon\n\n') 
+        help_lines.append('[X] ' + checklist_items.get(14)[0] +': error if any ngons found.\n     A polygon that is made up of five or more vertices. \n     Anything over a quad (4 sides) is considered an ngon\n\n')
          
-    cmds.scrollField(checklist_items_help_scroll_field, e=True, ip=0, it='[X] ' + checklist_items.get(15)[0] +': error if is found.\n    A non-manifold geometry is a 3D shape that cannot be\n    unfolded into a 2D surface with all its normals pointing\n    the same direction.\n    For example, objects with faces inside of it.\n\n')
+        help_lines.append('[X] ' + checklist_items.get(15)[0] +': error if is found.\n    A non-manifold geometry is a 3D shape that cannot be\n    unfolded into a 2D surface with all its normals pointing\n    the same direction.\n    For example, objects with faces inside of it.\n\n')
      
-    cmds.scrollField(checklist_items_help_scroll_field, e=True, ip=0, it='[X] ' + checklist_items.get(17)[0] +': error if rotation(XYZ) not frozen.' + '\n     It doesn\'t check objects with incoming connections,\n     for example, animations or rigs.' + '\n\n')
+        help_lines.append('[X] ' + checklist_items.get(17)[0] +': error if rotation(XYZ) not frozen.' + '\n     It doesn\'t check objects with incoming connections,\n     for example, animations or rigs.' + '\n\n')
      
-    cmds.scrollField(checklist_items_help_scroll_field, e=True, ip=0, it='[X] ' + checklist_items.get(18)[0] +': error if animated visibility is found' + '\n     warning if hidden object is found.' + '\n\n') 
+        help_lines.append('[X] ' + checklist_items.get(18)[0] +': error if animated visibility is found' + '\n     warning if hidden object is found.' + '\n\n')
     
-    cmds.scrollField(checklist_items_help_scroll_field, e=True, ip=0, it='[X] ' + checklist_items.get(19)[0] +': error if any non-deformer history found.' + '\n\n') 
+        help_lines.append('[X] ' + checklist_items.get(19)[0] +': error if any non-deformer history found.' + '\n\n')
    
-    cmds.scrollField(checklist_items_help_scroll_field, e=True, ip=0, it='[X] ' + checklist_items.get(20)[0] +': error if incorrect color space found.' + '\n     It only checks common nodes for Redshift and Arnold\n     Generally "sRGB" -> float3(color), and "Raw" -> float(value).\n\n')
+        help_lines.append('[X] ' + checklist_items.get(20)[0] +': error if incorrect color space found.' + '\n     It only checks common nodes for Redshift and Arnold\n     Generally "sRGB" -> float3(color), and "Raw" -> float(value).\n\n')
     
-    cmds.scrollField(checklist_items_help_scroll_field, e=True, ip=0, it='\n\n  Guidelines: (Same as Canvas)\n - Refer to the Soft Skill and Asset Pages on Canvas to review your specific deliverables. If you have any questions, contact the instructor.')
+        help_lines.append('\n\n  Guidelines: (Same as Canvas)\n - Refer to the Soft Skill and Asset Pages on Canvas to review your specific deliverables. If you have any questions, contact the instructor.')
     
-    cmds.scrollField(checklist_items_help_scroll_field, e=True, ip=0, it='\n\n - Project Clean up:\n\n1. Use the file path editor (windows > general editor > file path editor) to make sure all your textures are located in you current project.\n\n2.Clean up the most recent scene.  (delete history, freeze transforms, delete empty group nodes)\n\n3.Clean up the Hypershade library (in the Hypershade Edit-Delete unused nodes.)\n\n4.Make sure display layers are used correctly (do they contain the right Pieces of geo in them, and do they make sense.)\n')
+        help_lines.append('\n\n - Project Clean up:\n\n1. Use the file path editor (windows > general editor > file path editor) to make sure all your textures are located in you current project.\n\n2.Clean up the most recent scene.  (delete history, freeze transforms, delete empty group nodes)\n\n3.Clean up the Hypershade library (in the Hypershade Edit-Delete unused nodes.)\n\n4.Make sure display layers are used correctly (do they contain the right Pieces of geo in them, and do they make sense.)\n')
+        
+        help_text = ''.join(help_lines)
+        checklist_help_text["text"] = help_text
     
+    checklist_items_help_scroll_field = cmds.scrollField(editable=False, wordWrap=True, fn="smallPlainLabelFont", text=help_text)
     cmds.scrollField(checklist_items_help_scroll_field, e=True, ip=1, it='') # Bring Back to the Top
 
     cmds.separator(h=checklist_spacing, style='none') # Empty Space
@@ -389,17 +414,17 @@ def build_gui_help_ats_cmi_modeling_checklist():
 
     # Footer =============
     cmds.separator(h=15, style='none') # Empty Space
-    cmds.rowColumnLayout(nc=2, cw=[(1, 140),(2, 140)], cs=[(1,10),(2, 0)], p="main_column")
+    cmds.rowColumnLayout(p="main_column", **help_footer_layout)
     cmds.text('Alexander T. Santiago  ')
-    cmds.text(l='<a href="mailto:asanti89@nmsu.edu">asanti89@nmsu.edu</a>', hl=True, highlightColor=[1,1,1])
-    cmds.rowColumnLayout(nc=2, cw=[(1, 140),(2, 140)], cs=[(1,10),(2, 0)], p="main_column")
+    cmds.text(l='<a href="mailto:asanti89@nmsu.edu">asanti89@nmsu.edu</a>', hl=True, highlightColor=link_color)
+    cmds.rowColumnLayout(p="main_column", **help_footer_layout)
     cmds.separator(h=15, style='none') # Empty Space
-    cmds.text(l='<a href="https://github.com/atsantiago">Github</a>', hl=True, highlightColor=[1,1,1])
+    cmds.text(l='<a href="https://github.com/atsantiago">Github</a>', hl=True, highlightColor=link_color)
     cmds.separator(h=7, style='none') # Empty Space
     
     
     # Close Button 
-    cmds.rowColumnLayout(nc=1, cw=[(1, 300)], cs=[(1,10)], p="main_column")
+    cmds.rowColumnLayout(p="main_column", **single_column_layout)
     cmds.separator(h=5, style='none')
     cmds.button(l='OK', h=30, c=lambda args: close_help_gui())
     cmds.separator(h=8, style='none')
@@ -429,7 +454,7 @@ def build_gui_help_ats_cmi_modeling_checklist():
 # Item 1 - Scene Units =========================================================================
 def check_scene_units():
     item_name = checklist_items.get(1)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
+    item_id = checklist_item_ids.get(1)
     expected_value = checklist_items.get(1)[1]
     received_value = cmds.currentUnit( query=True, linear=True )
     issues_found = 0
@@ -441,7 +466,7 @@ def check_scene_units():
         cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: patch_scene_units())
         issues_found = 1
         
-    cmds.text("output_" + item_id, e=True, l=str(received_value).capitalize() )
+    set_output_label(item_id, str(received_value).capitalize())
     
     # Patch Function ----------------------
     def patch_scene_units():
@@ -458,7 +483,7 @@ def check_scene_units():
             try:
                 cmds.currentUnit( linear=str(expected_value ))
                 print("Your " + item_name.lower() + " was changed to " + str(expected_value))
-            except:
+            except RuntimeError:
                 cmds.warning('Failed to use custom setting "' + str(expected_value) +  '"  as your new scene unit.')
             check_scene_units()
         else:
@@ -469,12 +494,12 @@ def check_scene_units():
         string_status = str(issues_found) + " issue found. The expected " + item_name.lower() + ' was "'  + str(expected_value).capitalize() + '" and yours is "' + str(received_value).capitalize() + '"'
     else: 
         string_status = str(issues_found) + " issues found. The expected " + item_name.lower() + ' was "'  + str(expected_value).capitalize() + '" and yours is "' + str(received_value).capitalize() + '"'
-    return '\n*** ' + item_name + " ***\n" + string_status
+    return report_section_template.format(item_name, string_status)
 
 # Item 2 - Output Resolution (MODIFIED) =========================================================================
 def check_output_resolution():
     item_name = checklist_items[2][0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
+    item_id = checklist_item_ids.get(2)
     expected_value = checklist_items[2][1]
     
     # Check Custom Value
@@ -484,29 +509,32 @@ def check_output_resolution():
             custom_settings_failed = True
             expected_value = settings_default_checklist_values[2][1]
             
-    received_value = [cmds.getAttr("defaultResolution.width"), cmds.getAttr("defaultResolution.height")]
+    received_width = str(cmds.getAttr("defaultResolution.width"))
+    received_height = str(cmds.getAttr("defaultResolution.height"))
+    received_resolution = received_width + 'x' + received_height
+    expected_width, expected_height = str(expected_value[0]), str(expected_value[1])
     issues_found = 0
     
     is_resolution_valid = False
     
-    if str(received_value[0]) == str(expected_value[0]) or str(received_value[1]) == str(expected_value[1]) or str(received_value[0]) == str(expected_value[1]) or str(received_value[1]) == str(expected_value[0]):
+    if received_width in (expected_width, expected_height) or received_height in (expected_width, expected_height):
         is_resolution_valid=True
     
 
     if is_resolution_valid:
-        cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message(item_name + ': "' + str(received_value[0]) + 'x' + str(received_value[1]) + '".')) 
+        cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message(item_name + ': "' + received_resolution + '".')) 
         issues_found = 0
     else: 
         cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: patch_output_resolution())
         issues_found = 1
         
-    cmds.text("output_" + item_id, e=True, l=str(received_value[0]) + 'x' + str(received_value[1]) )
+    set_output_label(item_id, received_resolution)
     
     # Patch Function ----------------------
     def patch_output_resolution():
         user_input = cmds.confirmDialog(
                     title=item_name,
-                    message='Either your height or width should match the resolution from the guidelines. \nIt doesn\'t need to be both!\nSo make sure you turn on the option "Maintain the width/height ratio" and make at least one of them match to ensure that your render is not too small, or too big.\nPlease make sure your width or height is "' + str(expected_value[0]) + '" or "' + str(expected_value[1]) + '" and try again.',
+                    message='Either your height or width should match the resolution from the guidelines. \nIt doesn\'t need to be both!\nSo make sure you turn on the option "Maintain the width/height ratio" and make at least one of them match to ensure that your render is not too small, or too big.\nPlease make sure your width or height is "' + expected_width + '" or "' + expected_height + '" and try again.',
                     button=['OK', 'Ignore Issue'],
                     defaultButton='OK',
                     cancelButton='Ignore Issue',
@@ -520,18 +548,18 @@ def check_output_resolution():
             
     # Return string for report ------------
     if issues_found > 0:
-        string_status = str(issues_found) + " issue found. The expected values for " + item_name.lower() + ' were "'  + str(expected_value[0]) + '" or "' + str(expected_value[1]) + '" and yours is "' + str(received_value[0]) + 'x' + str(received_value[1]) + '"'
+        string_status = str(issues_found) + " issue found. The expected values for " + item_name.lower() + ' were "'  + expected_width + '" or "' + expected_height + '" and yours is "' + received_resolution + '"'
     else: 
-        string_status = str(issues_found) + " issues found. The expected values for " + item_name.lower() + ' were "'  + str(expected_value[0]) + '" or "' + str(expected_value[1]) + '" and yours is "' + str(received_value[0]) + 'x' + str(received_value[1]) + '"'
+        string_status = str(issues_found) + " issues found. The expected values for " + item_name.lower() + ' were "'  + expected_width + '" or "' + expected_height + '" and yours is "' + received_resolution + '"'
     if custom_settings_failed:
         string_status = '1 issue found. The custom resolution settings provided couldn\'t be used to check your resolution'
         cmds.button("status_" + item_id, e=True, bgc=exception_color, l= '', c=lambda args: print_message('The custom value provided couldn\'t be used to check the resolution.', as_warning=True))
-    return '\n*** ' + item_name + " ***\n" + string_status
+    return report_section_template.format(item_name, string_status)
 
 # Item 3 - Total Texture Count =========================================================================
 def check_total_texture_count():
     item_name = checklist_items.get(3)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
+    item_id = checklist_item_ids.get(3)
     expected_value = checklist_items.get(3)[1] 
 
     received_value = 0 
@@ -544,17 +572,29 @@ def check_total_texture_count():
 
 
     # Count Textures
-    all_file_nodes = cmds.ls(type="file")
+    all_file_nodes = list_scene_nodes("file")
+    udim_file_patterns = []
     for file in all_file_nodes:
         uv_tiling_mode = cmds.getAttr(file + '.uvTilingMode')
         if uv_tiling_mode != 0:
             use_frame_extension = cmds.getAttr(file + '.useFrameExtension')
             file_path = cmds.getAttr(file + ".fileTextureName")
-            udim_file_pattern = maya.app.general.fileTexturePathResolver.getFilePatternString(file_path, use_frame_extension, uv_tiling_mode)
-            udim_textures = maya.app.general.fileTexturePathResolver.findAllFilesForPattern(udim_file_pattern, None)
-            received_value +=len(udim_textures)
+            udim_file_patterns.append(maya.app.general.fileTexturePathResolver.getFilePatternString(file_path, use_frame_extension, uv_tiling_mode))
         else:
             received_value +=1
+    
+    # Count UDIM Tiles (Only reads the disk, no Maya calls, so it can run in parallel)
+    def find_udim_textures(udim_file_pattern):
+        return maya.app.general.fileTexturePathResolver.findAllFilesForPattern(udim_file_pattern, None)
+    
+    if ThreadPoolExecutor is not None and len(udim_file_patterns) > 1:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            all_udim_textures = list(executor.map(find_udim_textures, udim_file_patterns))
+    else:
+        all_udim_textures = [find_udim_textures(pattern) for pattern in udim_file_patterns]
+    
+    for udim_textures in all_udim_textures:
+        received_value +=len(udim_textures)
         
     
     # Manager Message
@@ -575,7 +615,7 @@ def check_total_texture_count():
         cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: warning_total_texture_count())
         issues_found = 1
         
-    cmds.text("output_" + item_id, e=True, l=received_value )
+    set_output_label(item_id, received_value)
     
 
     # Patch Function ----------------------
@@ -602,17 +642,17 @@ def check_total_texture_count():
     if custom_settings_failed:
         string_status = '1 issue found. The custom value provided couldn\'t be used to check your total texture count'
         cmds.button("status_" + item_id, e=True, bgc=exception_color, l= '', c=lambda args: print_message('The custom value provided couldn\'t be used to check your total texture count', as_warning=True))
-    return '\n*** ' + item_name + " ***\n" + string_status
+    return report_section_template.format(item_name, string_status)
     
 # Item 4 - File Paths (MODIFIED) =========================================================================
 def check_network_file_paths():
     item_name = checklist_items.get(4)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
+    item_id = checklist_item_ids.get(4)
     expected_value = checklist_items.get(4)[1]
     incorrect_file_nodes = []
     
     # Count Incorrect File Nodes
-    all_file_nodes = cmds.ls(type="file")
+    all_file_nodes = list_scene_nodes("file")
     for file in all_file_nodes:
         file_path = cmds.getAttr(file + ".fileTextureName")
         if file_path != '':
@@ -632,7 +672,7 @@ def check_network_file_paths():
         cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: warning_network_file_paths())
         issues_found = len(incorrect_file_nodes)
         
-    cmds.text("output_" + item_id, e=True, l=len(incorrect_file_nodes) )
+    set_output_label(item_id, len(incorrect_file_nodes))
     
     # Patch Function ----------------------
     def warning_network_file_paths():
@@ -651,23 +691,21 @@ def check_network_file_paths():
             cmds.button("status_" + item_id, e=True, l= '')
     
     # Return string for report ------------
-    issue_string = "issues"
-    if issues_found == 1:
-        issue_string = "issue"
     if issues_found > 0:
-        string_status = str(issues_found) + ' ' + issue_string + ' found.\n'
+        status_lines = []
         for file_node in incorrect_file_nodes: 
-            string_status = string_status + '"' + file_node +  '" isn\'t pointing to the a "sourceimages" folder. Your texture files should be sourced from a proper Maya project.\n'
+            status_lines.append('"' + file_node +  '" isn\'t pointing to the a "sourceimages" folder. Your texture files should be sourced from a proper Maya project.')
+        string_status = format_issue_lines(issues_found, status_lines) + '\n'
     else: 
         string_status = str(issues_found) + ' issues found. All textures were sourced from the network'
-    return '\n*** ' + item_name + " ***\n" + string_status
+    return report_section_template.format(item_name, string_status)
 
 
     
 # Item 6 - Unparented Objects =========================================================================
 def check_unparented_objects():
     item_name = checklist_items.get(6)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
+    item_id = checklist_item_ids.get(6)
     expected_value = checklist_items.get(6)[1]
     unparented_objects = []
 
@@ -688,7 +726,7 @@ def check_unparented_objects():
         cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: warning_unparented_objects())
         issues_found = len(unparented_objects)
         
-    cmds.text("output_" + item_id, e=True, l=len(unparented_objects) )
+    set_output_label(item_id, len(unparented_objects))
     
     # Patch Function ----------------------
     def warning_unparented_objects():
@@ -707,52 +745,45 @@ def check_unparented_objects():
             cmds.button("status_" + item_id, e=True, l= '')
     
     # Return string for report ------------
-    issue_string = "issues"
-    if issues_found == 1:
-        issue_string = "issue"
     if issues_found > 0:
-        string_status = str(issues_found) + ' ' + issue_string + ' found.\n'
+        status_lines = []
         for obj in unparented_objects: 
-            string_status = string_status + '"' + obj +  '" has no parent or child nodes. It should likely be part of a hierarchy.\n'
-        string_status = string_status[:-1]
+            status_lines.append('"' + obj +  '" has no parent or child nodes. It should likely be part of a hierarchy.')
+        string_status = format_issue_lines(issues_found, status_lines)
     else: 
         string_status = str(issues_found) + ' issues found. No unparented objects were found.'
-    return '\n*** ' + item_name + " ***\n" + string_status
+    return report_section_template.format(item_name, string_status)
 
 
 # Item 7 - Total Triangle Count =========================================================================
 def check_total_triangle_count():
     item_name = checklist_items.get(7)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
+    item_id = checklist_item_ids.get(7)
     expected_value = checklist_items.get(7)[1][1]
     inbetween_value = checklist_items.get(7)[1][0]
-    unparented_objects = []
     
     # Check Custom Value
     custom_settings_failed = False
     if isinstance(expected_value, int) == False or isinstance(inbetween_value, int) == False:
         custom_settings_failed = True
 
-    all_poly_count = cmds.ls(type="mesh", flatten=True)
-    scene_tri_count = 0;
-    smoothedObjCount = 0;
+    all_poly_count = list_scene_nodes("mesh")
     
-    for obj in all_poly_count:
-        smooth_level = cmds.getAttr(obj + ".smoothLevel")
-        smooth_state = cmds.getAttr(obj + ".displaySmoothMesh")
-        total_tri_count = cmds.polyEvaluate(obj, t=True)
-        total_edge_count = cmds.polyEvaluate(obj, e=True)
-        total_face_count = cmds.polyEvaluate(obj, f=True)
+    # Bind Maya commands once for the function below
+    get_attr = cmds.getAttr
+    poly_evaluate = cmds.polyEvaluate
+    
+    def get_mesh_tri_count(obj):
+        smooth_level = get_attr(obj + ".smoothLevel")
+        smooth_state = get_attr(obj + ".displaySmoothMesh")
 
         if smooth_state > 0 and smooth_level != 0:
-            one_subdiv_tri_count = (total_edge_count * 4)
-            if smooth_level > 1:
-                multi_subdiv_tri_count = one_subdiv_tri_count * (4 ** (smooth_level-1))
-                scene_tri_count = scene_tri_count + multi_subdiv_tri_count
-            else:
-                scene_tri_count += one_subdiv_tri_count
-        else:
-            scene_tri_count += total_tri_count
+            # 4 triangles per cage edge at level 1, times 4 for every extra level
+            total_edge_count = poly_evaluate(obj, e=True)
+            return total_edge_count * (4 ** smooth_level)
+        return poly_evaluate(obj, t=True)
+    
+    scene_tri_count = sum(get_mesh_tri_count(obj) for obj in all_poly_count)
                 
     if scene_tri_count < expected_value and scene_tri_count > inbetween_value:
         cmds.button("status_" + item_id, e=True, bgc=warning_color, l= '', c=lambda args: warning_total_triangle_count())
@@ -769,7 +800,7 @@ def check_total_triangle_count():
         patch_message = 'Your scene has ' + str(scene_tri_count) + ' triangles. You should try to keep it under ' + str(expected_value) + '.\n\n' + 'In case you see a different number on your "Heads Up Display > Poly Count" option.  It\'s likely that you have "shapeOrig" nodes in your scene. These are intermediate shape nodes usually created by deformers. If you don\'t have deformations on your scene, you can delete these to reduce triangle count.\n'
         cancel_message= "Ignore Issue"
         
-    cmds.text("output_" + item_id, e=True, l=scene_tri_count )
+    set_output_label(item_id, scene_tri_count)
     
     # Patch Function ----------------------
     def warning_total_triangle_count():
@@ -798,12 +829,12 @@ def check_total_triangle_count():
     if custom_settings_failed:
         string_status = '1 issue found. The custom value provided couldn\'t be used to check your total triangle count'
         cmds.button("status_" + item_id, e=True, bgc=exception_color, l= '', c=lambda args: print_message('The custom value provided couldn\'t be used to check your total triangle count', as_warning=True))
-    return '\n*** ' + item_name + " ***\n" + string_status
+    return report_section_template.format(item_name, string_status)
 
 # Item 8 - Total Poly Object Count =========================================================================
 def check_total_poly_object_count():
     item_name = checklist_items.get(8)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
+    item_id = checklist_item_ids.get(8)
     expected_value = checklist_items.get(8)[1][1]
     inbetween_value = checklist_items.get(8)[1][0]
     
@@ -812,7 +843,7 @@ def check_total_poly_object_count():
     if isinstance(expected_value, int) == False or isinstance(inbetween_value, int) == False:
         custom_settings_failed = True
     
-    all_polymesh = cmds.ls(type= "mesh")
+    all_polymesh = list_scene_nodes("mesh")
 
     if len(all_polymesh) < expected_value and len(all_polymesh) > inbetween_value:
         cmds.button("status_" + item_id, e=True, bgc=warning_color, l= '', c=lambda args: warning_total_poly_object_count())
@@ -829,7 +860,7 @@ def check_total_poly_object_count():
         patch_message = str(len(all_polymesh)) + ' polygon meshes in your scene. \nTry to keep this number under ' + str(expected_value) + '.'
         cancel_message= "Ignore Issue"
         
-    cmds.text("output_" + item_id, e=True, l=len(all_polymesh) )
+    set_output_label(item_id, len(all_polymesh))
     
     # Patch Function ----------------------
     def warning_total_poly_object_count():
@@ -857,107 +888,15 @@ def check_total_poly_object_count():
     if custom_settings_failed:
         string_status = '1 issue found. The custom value provided couldn\'t be used to check your total poly count'
         cmds.button("status_" + item_id, e=True, bgc=exception_color, l= '', c=lambda args: print_message('The custom value provided couldn\'t be used to check your total poly count', as_warning=True))
-    return '\n*** ' + item_name + " ***\n" + string_status
+    return report_section_template.format(item_name, string_status)
     
     
 
     
-# Item 10 - Redshift Shadow Casting Light Count =========================================================================
-def check_rs_shadow_casting_light_count():
-    item_name = checklist_items.get(10)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
-    expected_value = checklist_items.get(10)[1][1]
-    inbetween_value = checklist_items.get(10)[1][0]
-    
-    # Check Custom Values
-    custom_settings_failed = False
-    if isinstance(expected_value, int) == False or isinstance(inbetween_value, int) == False:
-        custom_settings_failed = True
-    
-    rs_physical_type = "RedshiftPhysicalLight" # Used to check if Redshift is loaded
-    
-    node_types = cmds.ls(nodeTypes=True)
-    
-    if rs_physical_type in node_types: # is RS loaded?
-    
-        rs_physical = cmds.ls(type=rs_physical_type)
-        rs_photometric = cmds.ls(type="RedshiftIESLight")
-        rs_portal = cmds.ls(type="RedshiftPortalLight")
-        rs_dome = cmds.ls(type="RedshiftDomeLight")
-        
-        all_rs_lights = []
-        all_rs_lights.extend(rs_physical)
-        all_rs_lights.extend(rs_photometric)
-        all_rs_lights.extend(rs_portal)
-        all_rs_lights.extend(rs_dome)
-        
-        rs_shadow_casting_lights = []
-       
-        for rs_light in all_rs_lights:
-            if rs_light != "<done>":
-                if cmds.objectType(rs_light) != "RedshiftPortalLight": # For some odd reason portal lights use an attribute called "shadows" instead of "shadow"
-                    rs_shadow_state = cmds.getAttr (rs_light + ".shadow")
-                else:
-                    rs_shadow_state = cmds.getAttr (rs_light + ".shadows")
-                if rs_shadow_state == 1:
-                    rs_shadow_casting_lights.append(rs_light)
-      
-       
-        if len(rs_shadow_casting_lights) < expected_value and len(rs_shadow_casting_lights) > inbetween_value:
-            cmds.button("status_" + item_id, e=True, bgc=warning_color, l= '', c=lambda args: warning_rs_shadow_casting_light_count())
-            issues_found = 0;
-            patch_message = 'Your scene contains "' + str(len(rs_shadow_casting_lights)) + '" Redshift shadow casting lights, which is a high number. \nConsider optimizing it if possible.'
-            cancel_message= "Ignore Warning"
-        elif len(rs_shadow_casting_lights) < expected_value:
-            cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message('Your scene contains "' +str(len(rs_shadow_casting_lights)) + '" Redshift shadow casting lights.')) 
-            issues_found = 0;
-            patch_message = ''
-        else: 
-            cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: warning_rs_shadow_casting_light_count())
-            issues_found = 1;
-            patch_message = 'Your scene contains ' + str(len(rs_shadow_casting_lights)) + ' Redshift shadow casting lights.\nTry to keep this number under ' + str(expected_value) + '.'
-            cancel_message= "Ignore Issue"
-            
-        cmds.text("output_" + item_id, e=True, l=len(rs_shadow_casting_lights) )
-        
-        # Patch Function ----------------------
-        def warning_rs_shadow_casting_light_count():
-            user_input = cmds.confirmDialog(
-                        title=item_name,
-                        message= patch_message,
-                        button=['OK', cancel_message],
-                        defaultButton='OK',
-                        cancelButton=cancel_message,
-                        dismissString=cancel_message, 
-                        icon="warning")
-
-            if user_input == "Ignore Warning":
-                cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message(str(issues_found) + ' issues found. Your scene contains ' + str(len(rs_shadow_casting_lights)) +  ' Redshift shadow casting lights, which is a high number. \nConsider optimizing it if possible.') )
-            else:
-                cmds.button("status_" + item_id, e=True, l= '')
-        
-        # Return string for report ------------
-        if len(rs_shadow_casting_lights) < expected_value and len(rs_shadow_casting_lights) > inbetween_value:
-            string_status = str(issues_found) + ' issues found. Your scene contains "' +  str(len(rs_shadow_casting_lights)) + '" Redshift shadow casting lights, which is a high number. Consider optimizing it if possible.'
-        elif len(rs_shadow_casting_lights) < expected_value:
-            string_status = str(issues_found) + ' issues found. Your scene contains "' + str(len(rs_shadow_casting_lights)) + '" Redshift shadow casting lights.'
-        else: 
-            string_status = str(issues_found) + ' issue found. Your scene contains "' + str(len(rs_shadow_casting_lights)) + '" Redshift shadow casting lights, you should keep this number under "' + str(expected_value) + '".'
-        if custom_settings_failed:
-            string_status = '1 issue found. The custom value provided couldn\'t be used to check your Redshift shadow casting lights.'
-            cmds.button("status_" + item_id, e=True, bgc=exception_color, l= '', c=lambda args: print_message('The custom value provided couldn\'t be used to check your Redshift shadow casting lights.', as_warning=True))
-        return '\n*** ' + item_name + " ***\n" + string_status
-    else:
-        cmds.button("status_" + item_id, e=True, bgc=exception_color, l= '', c=lambda args: print_message('No Redshift light types exist in the scene. Redshift plugin doesn\'t seem to be loaded.', as_warning=True))
-        cmds.text("output_" + item_id, e=True, l='No Redshift' )
-        return '\n*** ' + item_name + " ***\n" + '0 issues found, but no Redshift light types exist in the scene. Redshift plugin doesn\'t seem to be loaded.'
-
-
-
 # Item 12 - Default Object Names ========================================================================= 
 def check_default_object_names():
     item_name = checklist_items.get(12)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
+    item_id = checklist_item_ids.get(12)
     expected_value = checklist_items.get(12)[1]
     
     offending_objects = []
@@ -1005,16 +944,15 @@ def check_default_object_names():
     cancel_message = 'Ignore Issue'
             
     if len(possible_offenders) != 0 and len(offending_objects) == 0:
-        cmds.text("output_" + item_id, e=True, l='[ ' + str(len(possible_offenders)) + ' ]' )
+        set_output_label(item_id, '[ ' + str(len(possible_offenders)) + ' ]')
         patch_message = patch_message_warning
         cancel_message = 'Ignore Warning'
     elif len(possible_offenders) == 0:
-        cmds.text("output_" + item_id, e=True, l=str(len(offending_objects)))
+        set_output_label(item_id, str(len(offending_objects)))
         patch_message = patch_message_error
     else:
-        cmds.text("output_" + item_id, e=True, l=str(len(offending_objects)) + ' + [ ' + str(len(possible_offenders)) + ' ]' )
+        set_output_label(item_id, str(len(offending_objects)) + ' + [ ' + str(len(possible_offenders)) + ' ]')
         patch_message = patch_message_error + '\n\n' + patch_message_warning
-        return_message = patch_message_error + '\n' + patch_message_warning
         
     # Patch Function ----------------------
     def warning_default_object_names():
@@ -1033,29 +971,23 @@ def check_default_object_names():
             cmds.button("status_" + item_id, e=True, l= '')
     
     # Return string for report ------------
-    issue_string = "issues"
-    if issues_found == 1:
-        issue_string = "issue"
     if issues_found > 0 or len(possible_offenders) > 0:
-        string_status = str(issues_found) + ' ' + issue_string + ' found.\n'
+        status_lines = []
         for obj in offending_objects: 
-            string_status = string_status + '"' + obj +  '" was not named properly. Please rename your object descriptively.\n'
-        if len(offending_objects) != 0 and len(possible_offenders) == 0:
-            string_status = string_status[:-1]
+            status_lines.append('"' + obj +  '" was not named properly. Please rename your object descriptively.')
         
         for obj in possible_offenders: 
-            string_status = string_status + '"' + obj +  '"  contains a string extremelly similar to the default names.\n'
-        if len(possible_offenders) != 0:
-            string_status = string_status[:-1]
+            status_lines.append('"' + obj +  '"  contains a string extremelly similar to the default names.')
+        string_status = format_issue_lines(issues_found, status_lines)
     else: 
         string_status = str(issues_found) + ' issues found. No unnamed objects were found, well done!'
-    return '\n*** ' + item_name + " ***\n" + string_status
+    return report_section_template.format(item_name, string_status)
 
 
 # Item 13 - Objects Assigned to lambert1 =========================================================================
 def check_objects_assigned_to_lambert1():
     item_name = checklist_items.get(13)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
+    item_id = checklist_item_ids.get(13)
     expected_value = checklist_items.get(13)[1]
     
     lambert1_objects = cmds.sets("initialShadingGroup", q=True) or []
@@ -1067,7 +999,7 @@ def check_objects_assigned_to_lambert1():
         cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: warning_objects_assigned_to_lambert1())
         issues_found = len(lambert1_objects)
         
-    cmds.text("output_" + item_id, e=True, l=len(lambert1_objects) )
+    set_output_label(item_id, len(lambert1_objects))
     
     if len(lambert1_objects) == 1:
         patch_message = str(len(lambert1_objects)) + ' object is assigned to lambert1. \nMake sure no objects are assigned to lambert1.\n\n(Too see a list of objects, generate a full report)'
@@ -1091,46 +1023,45 @@ def check_objects_assigned_to_lambert1():
             cmds.button("status_" + item_id, e=True, l= '')
     
     # Return string for report ------------
-    issue_string = "issues"
-    if issues_found == 1:
-        issue_string = "issue"
     if issues_found > 0:
-        string_status = str(issues_found) + ' ' + issue_string + ' found.\n'
+        status_lines = []
         for obj in lambert1_objects: 
-            string_status = string_status + '"' + obj +  '"  is assigned to lambert1. It should be assigned to another shader.\n'
-        string_status = string_status[:-1]
+            status_lines.append('"' + obj +  '"  is assigned to lambert1. It should be assigned to another shader.')
+        string_status = format_issue_lines(issues_found, status_lines)
     else: 
         string_status = str(issues_found) + ' issues found. No objects are assigned to lambert1.'
-    return '\n*** ' + item_name + " ***\n" + string_status
+    return report_section_template.format(item_name, string_status)
 
 # Item 14 - Ngons =========================================================================
 def check_ngons():
     item_name = checklist_items.get(14)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
+    item_id = checklist_item_ids.get(14)
     expected_value = checklist_items.get(14)[1]
     
 
 
     ngon_mel_command = 'string $ngons[] = `polyCleanupArgList 3 { "1","2","1","0","1","0","0","0","0","1e-005","0","1e-005","0","1e-005","0","-1","0" }`;'
     ngons_list = mel.eval(ngon_mel_command)
+    ngon_count = len(ngons_list)
+    ngon_count_label = str(ngon_count)
     cmds.select(clear=True)
     
     print('') # Clear Any Warnings
  
 
-    if len(ngons_list) == 0:
+    if ngon_count == 0:
         cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message('No ngons were found in your scene. Good job!')) 
         issues_found = 0
     else: 
         cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: warning_ngons())
-        issues_found = len(ngons_list)
+        issues_found = ngon_count
         
-    cmds.text("output_" + item_id, e=True, l=len(ngons_list) )
+    set_output_label(item_id, ngon_count)
     
-    if len(ngons_list) == 1:
-        patch_message = str(len(ngons_list)) + ' ngon found in your scene. \nMake sure no faces have more than 4 sides.\n\n(Too see a list of objects, generate a full report)'
+    if ngon_count == 1:
+        patch_message = ngon_count_label + ' ngon found in your scene. \nMake sure no faces have more than 4 sides.\n\n(Too see a list of objects, generate a full report)'
     else:
-        patch_message = str(len(ngons_list)) + ' ngons found in your scene. \nMake sure no faces have more than 4 sides.\n\n(Too see a list of objects, generate a full report)'
+        patch_message = ngon_count_label + ' ngons found in your scene. \nMake sure no faces have more than 4 sides.\n\n(Too see a list of objects, generate a full report)'
     
     # Patch Function ----------------------
     def warning_ngons():
@@ -1149,28 +1080,25 @@ def check_ngons():
             cmds.button("status_" + item_id, e=True, l= '')
     
     # Return string for report ------------
-    issue_string = "issues"
-    if issues_found == 1:
-        issue_string = "issue"
     if issues_found > 0:
-        string_status = str(issues_found) + ' ' + issue_string + ' found.\n'
+        status_lines = []
         for obj in ngons_list: 
-            string_status = string_status + '"' + obj +  '"  is an ngon (face with more than 4 sides).\n'
-        string_status = string_status[:-1]
+            status_lines.append('"' + obj +  '"  is an ngon (face with more than 4 sides).')
+        string_status = format_issue_lines(issues_found, status_lines)
     else: 
         string_status = str(issues_found) + ' issues found. No ngons were found in your scene.'
-    return '\n*** ' + item_name + " ***\n" + string_status
+    return report_section_template.format(item_name, string_status)
 
 # Item 15 - Non-manifold Geometry =========================================================================
 def check_non_manifold_geometry():
     item_name = checklist_items.get(15)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
+    item_id = checklist_item_ids.get(15)
     expected_value = checklist_items.get(15)[1]
     
     nonmanifold_geo = []
     nonmanifold_verts = []
     
-    all_geo = cmds.ls(type='mesh', long=True)
+    all_geo = list_scene_nodes("mesh", long_names=True)
    
     for geo in all_geo:
         obj_non_manifold_verts = cmds.polyInfo(geo, nmv=True) or []
@@ -1185,7 +1113,7 @@ def check_non_manifold_geometry():
         cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: warning_non_manifold_geometry())
         issues_found = len(nonmanifold_geo)
         
-    cmds.text("output_" + item_id, e=True, l=len(nonmanifold_geo) )
+    set_output_label(item_id, len(nonmanifold_geo))
     
     if len(nonmanifold_geo) == 1:
         patch_message = str(len(nonmanifold_geo)) + ' object with non-manifold geometry was found in your scene. \n\n(Too see a list of objects, generate a full report)'
@@ -1212,36 +1140,41 @@ def check_non_manifold_geometry():
             cmds.button("status_" + item_id, e=True, l= '')
     
     # Return string for report ------------
-    issue_string = "issues"
-    if issues_found == 1:
-        issue_string = "issue"
     if issues_found > 0:
-        string_status = str(issues_found) + ' ' + issue_string + ' found.\n'
+        status_lines = []
         for obj in nonmanifold_geo: 
-            string_status = string_status + '"' + get_short_name(obj) +  '"  has non-manifold geometry.\n'
-        string_status = string_status[:-1]
+            status_lines.append('"' + get_short_name(obj) +  '"  has non-manifold geometry.')
+        string_status = format_issue_lines(issues_found, status_lines)
     else: 
         string_status = str(issues_found) + ' issues found. No non-manifold geometry found in your scene.'
-    return '\n*** ' + item_name + " ***\n" + string_status
+    return report_section_template.format(item_name, string_status)
 
 
 # Item 17 - Frozen Transforms =========================================================================
 def check_frozen_transforms():
     item_name = checklist_items.get(17)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
+    item_id = checklist_item_ids.get(17)
     expected_value = checklist_items.get(17)[1]
     
     objects_no_frozen_transforms = []
     
-    all_transforms = cmds.ls(type='transform')
+    all_transforms = list_scene_nodes("transform")
+    
+    # Bind Maya commands once for the loop below
+    list_relatives = cmds.listRelatives
+    get_object_type = cmds.objectType
+    list_connections = cmds.listConnections
         
     for transform in all_transforms:
-        children = cmds.listRelatives(transform, c=True, pa=True) or []
+        children = list_relatives(transform, c=True, pa=True) or []
+        rotation = None
         for child in children:
-            object_type = cmds.objectType(child)
+            object_type = get_object_type(child)
             if object_type == 'mesh' or object_type == 'nurbsCurve':
-                if cmds.getAttr(transform + ".rotateX") != 0 or cmds.getAttr(transform + ".rotateY") != 0 or cmds.getAttr(transform + ".rotateZ") != 0:
-                    if len(cmds.listConnections(transform + ".rotateX") or []) == 0 and len(cmds.listConnections(transform + ".rotateY") or []) == 0 and len(cmds.listConnections(transform + ".rotateZ") or []) == 0 and len(cmds.listConnections(transform + ".rotate") or []) == 0:
+                if rotation is None:
+                    rotation = cmds.getAttr(transform + ".rotate")[0] # One query for X, Y and Z, reused by every child
+                if rotation[0] != 0 or rotation[1] != 0 or rotation[2] != 0:
+                    if len(list_connections(transform + ".rotateX") or []) == 0 and len(list_connections(transform + ".rotateY") or []) == 0 and len(list_connections(transform + ".rotateZ") or []) == 0 and len(list_connections(transform + ".rotate") or []) == 0:
                         objects_no_frozen_transforms.append(transform)
                        
     if len(objects_no_frozen_transforms) == 0:
@@ -1251,7 +1184,7 @@ def check_frozen_transforms():
         cmds.button("status_" + item_id, e=True, bgc=warning_color, l= '?', c=lambda args: warning_frozen_transforms())
         issues_found = len(objects_no_frozen_transforms)
         
-    cmds.text("output_" + item_id, e=True, l=len(objects_no_frozen_transforms) )
+    set_output_label(item_id, len(objects_no_frozen_transforms))
     
     if len(objects_no_frozen_transforms) == 1:
         patch_message = str(len(objects_no_frozen_transforms)) + ' object has un-frozen transformations. \n\n(Too see a list of objects, generate a full report)'
@@ -1277,44 +1210,47 @@ def check_frozen_transforms():
             cmds.button("status_" + item_id, e=True, l= '')
     
     # Return string for report ------------
-    issue_string = "issues"
-    if issues_found == 1:
-        issue_string = "issue"
     if issues_found > 0:
-        string_status = str(issues_found) + ' ' + issue_string + ' found.\n'
+        status_lines = []
         for obj in objects_no_frozen_transforms: 
-            string_status = string_status + '"' + obj +  '" has un-frozen transformations.\n'
-        string_status = string_status[:-1]
+            status_lines.append('"' + obj +  '" has un-frozen transformations.')
+        string_status = format_issue_lines(issues_found, status_lines)
     else: 
         string_status = str(issues_found) + ' issues found. No objects have un-frozen transformations.'
-    return '\n*** ' + item_name + " ***\n" + string_status
+    return report_section_template.format(item_name, string_status)
 
 # Item 18 - Animated Visibility =========================================================================
 def check_animated_visibility():
     item_name = checklist_items.get(18)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
+    item_id = checklist_item_ids.get(18)
     expected_value = checklist_items.get(18)[1]
     
     objects_animated_visibility = []
     objects_hidden = []
     
-    all_transforms = cmds.ls(type='transform')
+    all_transforms = list_scene_nodes("transform")
+    
+    # Bind Maya commands once for the loop below
+    list_attr = cmds.listAttr
+    get_attr = cmds.getAttr
+    list_connections = cmds.listConnections
+    node_type = cmds.nodeType
     
     for transform in all_transforms:
-        attributes = cmds.listAttr(transform)
+        attributes = list_attr(transform)
         not_outliner_hidden = False
         if 'hiddenInOutliner' in attributes:
-            outliner_hidden = cmds.getAttr(transform + ".hiddenInOutliner")
+            outliner_hidden = get_attr(transform + ".hiddenInOutliner")
 
         if 'visibility' in attributes and not outliner_hidden:
-            if cmds.getAttr(transform + ".visibility") == 0:
+            if get_attr(transform + ".visibility") == 0:
                 children = cmds.listRelatives(transform, s=True, pa=True) or []
                 if len(children) != 0:
-                    if cmds.nodeType(children[0]) != "camera":
+                    if node_type(children[0]) != "camera":
                         objects_hidden.append(transform)
-        input_nodes = cmds.listConnections(transform + ".visibility", destination=False, source=True) or []
+        input_nodes = list_connections(transform + ".visibility", destination=False, source=True) or []
         for node in input_nodes:
-            if 'animCurve' in cmds.nodeType(node):
+            if 'animCurve' in node_type(node):
                 objects_animated_visibility.append(transform)
             
     
@@ -1336,18 +1272,17 @@ def check_animated_visibility():
     patch_message = ''
             
     if len(objects_hidden) != 0 and len(objects_animated_visibility) == 0:
-        cmds.text("output_" + item_id, e=True, l='[ ' + str(len(objects_hidden)) + ' ]' )
+        set_output_label(item_id, '[ ' + str(len(objects_hidden)) + ' ]')
         patch_message = patch_message_warning
         cancel_message = 'Ignore Warning'
         buttons_to_add.append('Select Hidden Objects')
     elif len(objects_hidden) == 0:
-        cmds.text("output_" + item_id, e=True, l=str(len(objects_animated_visibility)))
+        set_output_label(item_id, str(len(objects_animated_visibility)))
         patch_message = patch_message_error
         buttons_to_add.append('Select Objects With Animated Visibility')
     else:
-        cmds.text("output_" + item_id, e=True, l=str(len(objects_animated_visibility)) + ' + [ ' + str(len(objects_hidden)) + ' ]' )
+        set_output_label(item_id, str(len(objects_animated_visibility)) + ' + [ ' + str(len(objects_hidden)) + ' ]')
         patch_message = patch_message_error + '\n\n' + patch_message_warning
-        return_message = patch_message_error + '\n' + patch_message_warning
         buttons_to_add.append('Select Hidden Objects')
         buttons_to_add.append('Select Objects With Animated Visibility')
     
@@ -1388,23 +1323,17 @@ def check_animated_visibility():
             cmds.button("status_" + item_id, e=True, l= '')
         
     # Return string for report ------------
-    issue_string = "issues"
-    if issues_found == 1:
-        issue_string = "issue"
     if issues_found > 0 or len(objects_hidden) > 0:
-        string_status = str(issues_found) + ' ' + issue_string + ' found.\n'
+        status_lines = []
         for obj in objects_animated_visibility: 
-            string_status = string_status + '"' + obj +  '" has animated visibility.\n'
-        if len(objects_animated_visibility) != 0 and len(objects_hidden) == 0:
-            string_status = string_status[:-1]
+            status_lines.append('"' + obj +  '" has animated visibility.')
         
         for obj in objects_hidden: 
-            string_status = string_status + '"' + obj +  '" is hidden.\n'
-        if len(objects_hidden) != 0:
-            string_status = string_status[:-1]
+            status_lines.append('"' + obj +  '" is hidden.')
+        string_status = format_issue_lines(issues_found, status_lines)
     else: 
         string_status = str(issues_found) + ' issues found. No unnamed objects were found, well done!'
-    return '\n*** ' + item_name + " ***\n" + string_status
+    return report_section_template.format(item_name, string_status)
     
     
     
@@ -1412,7 +1341,7 @@ def check_animated_visibility():
 # Item 19 - Non Deformer History =========================================================================
 def check_non_deformer_history():
     item_name = checklist_items.get(19)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
+    item_id = checklist_item_ids.get(19)
     expected_value = checklist_items.get(19)[1]
     
     objects_non_deformer_history = []
@@ -1420,10 +1349,10 @@ def check_non_deformer_history():
     
 
     objects_to_check = []
-    objects_to_check.extend(cmds.ls(typ='nurbsSurface') or [])
-    objects_to_check.extend(cmds.ls(typ='mesh') or [])
-    objects_to_check.extend(cmds.ls(typ='subdiv') or [])
-    objects_to_check.extend(cmds.ls(typ='nurbsCurve') or [])
+    objects_to_check.extend(list_scene_nodes("nurbsSurface"))
+    objects_to_check.extend(list_scene_nodes("mesh"))
+    objects_to_check.extend(list_scene_nodes("subdiv"))
+    objects_to_check.extend(list_scene_nodes("nurbsCurve"))
     
     not_history_nodes = ['tweak', 'expression', 'unitConversion', 'time', 'objectSet', 'reference', 'polyTweak', 'blendShape', 'groupId', \
     'renderLayer', 'renderLayerManager', 'shadingEngine', 'displayLayer', 'skinCluster', 'groupParts', 'mentalraySubdivApprox', 'proximityWrap',\
@@ -1432,14 +1361,19 @@ def check_non_deformer_history():
     possible_not_history_nodes = ['nonLinear','ffd', 'curveWarp', 'wrap', 'shrinkWrap', 'sculpt', 'textureDeformer']
     
     # Find Offenders
+    history_node_types = {} # Objects often share history nodes, so each node type is only queried once
     for obj in objects_to_check:
         history = cmds.listHistory(obj, pdo=1) or []
         #Convert to string?
         for node in history:
-            if cmds.nodeType(node) not in not_history_nodes and cmds.nodeType(node) not in possible_not_history_nodes:
+            node_type = history_node_types.get(node)
+            if node_type is None:
+                node_type = cmds.nodeType(node)
+                history_node_types[node] = node_type
+            if node_type not in not_history_nodes and node_type not in possible_not_history_nodes:
                 if obj not in objects_non_deformer_history:
                     objects_non_deformer_history.append(obj)
-            if cmds.nodeType(node) in possible_not_history_nodes:
+            if node_type in possible_not_history_nodes:
                 if obj not in possible_objects_non_deformer_history:
                     possible_objects_non_deformer_history.append(obj)
 
@@ -1462,18 +1396,17 @@ def check_non_deformer_history():
     patch_message = ''
             
     if len(possible_objects_non_deformer_history) != 0 and len(objects_non_deformer_history) == 0:
-        cmds.text("output_" + item_id, e=True, l='[ ' + str(len(possible_objects_non_deformer_history)) + ' ]' )
+        set_output_label(item_id, '[ ' + str(len(possible_objects_non_deformer_history)) + ' ]')
         patch_message = patch_message_warning
         cancel_message = 'Ignore Warning'
         buttons_to_add.append('Select Objects With Suspicious Deformers')
     elif len(possible_objects_non_deformer_history) == 0:
-        cmds.text("output_" + item_id, e=True, l=str(len(objects_non_deformer_history)))
+        set_output_label(item_id, str(len(objects_non_deformer_history)))
         patch_message = patch_message_error
         buttons_to_add.append('Select Objects With Non-deformer History')
     else:
-        cmds.text("output_" + item_id, e=True, l=str(len(objects_non_deformer_history)) + ' + [ ' + str(len(possible_objects_non_deformer_history)) + ' ]' )
+        set_output_label(item_id, str(len(objects_non_deformer_history)) + ' + [ ' + str(len(possible_objects_non_deformer_history)) + ' ]')
         patch_message = patch_message_error + '\n\n' + patch_message_warning
-        return_message = patch_message_error + '\n' + patch_message_warning
         buttons_to_add.append('Select Objects With Suspicious Deformers')
         buttons_to_add.append('Select Objects With Non-deformer History')
     
@@ -1513,29 +1446,23 @@ def check_non_deformer_history():
             cmds.button("status_" + item_id, e=True, l= '')
     
     # Return string for report ------------
-    issue_string = "issues"
-    if issues_found == 1:
-        issue_string = "issue"
     if issues_found > 0 or len(possible_objects_non_deformer_history) > 0:
-        string_status = str(issues_found) + ' ' + issue_string + ' found.\n'
+        status_lines = []
         for obj in objects_non_deformer_history: 
-            string_status = string_status + '"' + obj +  '" contains non-deformer history.\n'
-        if len(objects_non_deformer_history) != 0 and len(possible_objects_non_deformer_history) == 0:
-            string_status = string_status[:-1]
+            status_lines.append('"' + obj +  '" contains non-deformer history.')
         
         for obj in possible_objects_non_deformer_history: 
-            string_status = string_status + '"' + obj +  '" contains deformers often used for modeling.\n'
-        if len(possible_objects_non_deformer_history) != 0:
-            string_status = string_status[:-1]
+            status_lines.append('"' + obj +  '" contains deformers often used for modeling.')
+        string_status = format_issue_lines(issues_found, status_lines)
     else: 
         string_status = str(issues_found) + ' issues found. No objects with non-deformer history!'
-    return '\n*** ' + item_name + " ***\n" + string_status
+    return report_section_template.format(item_name, string_status)
     
     
 # Item 20 - Textures Color Space =========================================================================
 def check_textures_color_space():
     item_name = checklist_items.get(20)[0]
-    item_id = item_name.lower().replace(" ","_").replace("-","_")
+    item_id = checklist_item_ids.get(20)
     expected_value = checklist_items.get(20)[1]
     
     objects_wrong_color_space = []
@@ -1553,7 +1480,7 @@ def check_textures_color_space():
                                   'RedshiftDisplacement':'texMap'}
 
     # Count Textures
-    all_file_nodes = cmds.ls(type="file")
+    all_file_nodes = list_scene_nodes("file")
     for file in all_file_nodes:
         color_space = cmds.getAttr(file + '.colorSpace')
         
@@ -1565,10 +1492,14 @@ def check_textures_color_space():
         suspicious_connections = []
         possible_suspicious_connections = []
         
-        if color_space.lower() == 'Raw'.lower():
+        is_raw = color_space.lower() == 'Raw'.lower()
+        is_srgb = color_space.lower() == 'sRGB'.lower()
+        
+        if is_raw or is_srgb:
             for in_con in intput_node_connections:
-                node = in_con.split('.')[0]
-                node_in_con = in_con.split('.')[1]
+                split_con = in_con.split('.')
+                node = split_con[0]
+                node_in_con = split_con[1]
                 
                 node_type = cmds.objectType(node)
                 
@@ -1582,31 +1513,20 @@ def check_textures_color_space():
                 
                 if should_be_checked:
                     data_type = cmds.getAttr(in_con, type=True)
-                    if data_type == 'float3' and (node_type in float3_to_float_exceptions and node_in_con in float3_to_float_exceptions.values()) == False:
+                    is_float3_exception = node_type in float3_to_float_exceptions and node_in_con in float3_to_float_exceptions.values()
+                    
+                    # Raw should only feed float (value) connections
+                    if is_raw:
+                        if data_type == 'float3' and is_float3_exception == False:
                             has_suspicious_connection = True
                             suspicious_connections.append(in_con)
-        
-        if color_space.lower() == 'sRGB'.lower():
-            for in_con in intput_node_connections:
-                node = in_con.split('.')[0]
-                node_in_con = in_con.split('.')[1]
-                
-                node_type = cmds.objectType(node)
-                
-                if node_type in error_types:
-                    has_error_node_type = True
-                
-                should_be_checked = False
-                for types in check_types:
-                    if node_type.startswith(types):
-                        should_be_checked = True
-                
-                if should_be_checked:
-                    data_type = cmds.getAttr(in_con, type=True)
-                    if data_type == 'float':
+                    
+                    # sRGB should only feed float3 (color) connections
+                    else:
+                        if data_type == 'float':
                             has_suspicious_connection = True
                             suspicious_connections.append(in_con)
-                    if node_type in float3_to_float_exceptions and node_in_con in float3_to_float_exceptions.values():
+                        if is_float3_exception:
                             has_suspicious_connection = True
                             suspicious_connections.append(in_con)
                   
@@ -1617,20 +1537,26 @@ def check_textures_color_space():
                 possible_objects_wrong_color_space.append([file,suspicious_connections])
            
     
+    # Count Issues (Both lists are complete at this point, so the counts are computed once)
+    error_count = len(objects_wrong_color_space)
+    warning_count = len(possible_objects_wrong_color_space)
+    error_count_label = str(error_count)
+    warning_count_label = str(warning_count)
+    
     # Manage Strings
     cancel_message = 'Ignore Issue'
     buttons_to_add = []
     bottom_message = '\n\n (For a complete list, generate a full report)'
     
-    if len(possible_objects_wrong_color_space) == 1:
-        patch_message_warning = str(len(possible_objects_wrong_color_space)) + ' file node is using a color space that might not be appropriate for its connection.\n'
+    if warning_count == 1:
+        patch_message_warning = warning_count_label + ' file node is using a color space that might not be appropriate for its connection.\n'
     else:
-        patch_message_warning = str(len(possible_objects_wrong_color_space)) + ' file nodes are using a color space that might not be appropriate for its connection.\n'
+        patch_message_warning = warning_count_label + ' file nodes are using a color space that might not be appropriate for its connection.\n'
     
-    if len(objects_wrong_color_space) == 1:
-        patch_message_error = str(len(objects_wrong_color_space)) + ' file node is using a color space that is not appropriate for its connection.\n'
+    if error_count == 1:
+        patch_message_error = error_count_label + ' file node is using a color space that is not appropriate for its connection.\n'
     else:
-        patch_message_error = str(len(objects_wrong_color_space)) + ' file nodes are using a color space that is not appropriate for its connection.\n'
+        patch_message_error = error_count_label + ' file nodes are using a color space that is not appropriate for its connection.\n'
         
     
     # Manage Messages
@@ -1638,19 +1564,18 @@ def check_textures_color_space():
     might_have_issues_message = 'Select File Nodes With Possible Issues'
     has_issues_message = 'Select File Nodes With Issues'
             
-    if len(possible_objects_wrong_color_space) != 0 and len(objects_wrong_color_space) == 0:
-        cmds.text("output_" + item_id, e=True, l='[ ' + str(len(possible_objects_wrong_color_space)) + ' ]' )
+    if warning_count != 0 and error_count == 0:
+        set_output_label(item_id, '[ ' + warning_count_label + ' ]')
         patch_message = patch_message_warning
         cancel_message = 'Ignore Warning'
         buttons_to_add.append(might_have_issues_message)
-    elif len(possible_objects_wrong_color_space) == 0:
-        cmds.text("output_" + item_id, e=True, l=str(len(objects_wrong_color_space)))
+    elif warning_count == 0:
+        set_output_label(item_id, error_count_label)
         patch_message = patch_message_error
         buttons_to_add.append(has_issues_message)
     else:
-        cmds.text("output_" + item_id, e=True, l=str(len(objects_wrong_color_space)) + ' + [ ' + str(len(possible_objects_wrong_color_space)) + ' ]' )
+        set_output_label(item_id, error_count_label + ' + [ ' + warning_count_label + ' ]')
         patch_message = patch_message_error + '\n\n' + patch_message_warning
-        return_message = patch_message_error + '\n' + patch_message_warning
         buttons_to_add.append(might_have_issues_message)
         buttons_to_add.append(has_issues_message)
     
@@ -1659,15 +1584,15 @@ def check_textures_color_space():
     assembled_message.append(cancel_message)
     
     # Manage State
-    if len(possible_objects_wrong_color_space) != 0 and len(objects_wrong_color_space) == 0:
+    if warning_count != 0 and error_count == 0:
         cmds.button("status_" + item_id, e=True, bgc=warning_color, l= '', c=lambda args: warning_non_deformer_history()) 
         issues_found = 0
-    elif len(objects_wrong_color_space) == 0:
+    elif error_count == 0:
         cmds.button("status_" + item_id, e=True, bgc=pass_color, l= '', c=lambda args: print_message('No color space issues were found.')) 
         issues_found = 0
     else: 
         cmds.button("status_" + item_id, e=True, bgc=error_color, l= '?', c=lambda args: warning_non_deformer_history())
-        issues_found = len(objects_wrong_color_space)
+        issues_found = error_count
 
     # Patch Function ----------------------
     def warning_non_deformer_history():
@@ -1694,33 +1619,53 @@ def check_textures_color_space():
             cmds.button("status_" + item_id, e=True, l= '')
     
     # Return string for report ------------
-    issue_string = "issues"
-    if issues_found == 1:
-        issue_string = "issue"
-    if issues_found > 0 or len(possible_objects_wrong_color_space) > 0:
-        string_status = str(issues_found) + ' ' + issue_string + ' found.\n'
-        for obj in objects_wrong_color_space: 
-            string_status = string_status + '"' + obj[0] +  '" is using a color space (' + cmds.getAttr(obj[0] + '.colorSpace') + ') that is not appropriate for its connection.\n' 
-            for connection in obj[1]:
-                string_status = string_status + '   "' + connection + '" triggered this error.\n'
-        if len(objects_wrong_color_space) != 0 and len(possible_objects_wrong_color_space) == 0:
-            string_status = string_status[:-1]
+    if issues_found > 0 or warning_count > 0:
+        status_lines = []
+        for file_node, connections in objects_wrong_color_space: 
+            status_lines.append('"' + file_node +  '" is using a color space (' + cmds.getAttr(file_node + '.colorSpace') + ') that is not appropriate for its connection.')
+            for connection in connections:
+                status_lines.append('   "' + connection + '" triggered this error.')
         
-        for obj in possible_objects_wrong_color_space: 
-            string_status = string_status + '"' + obj[0] +  '" might be using a color space (' + cmds.getAttr(obj[0] + '.colorSpace') + ') that is not appropriate for its connection.\n'
-            for connection in obj[1]:
-                string_status = string_status + '   "' + connection + '" triggered this warning.\n'
-        if len(possible_objects_wrong_color_space) != 0:
-            string_status = string_status[:-1]
+        for file_node, connections in possible_objects_wrong_color_space: 
+            status_lines.append('"' + file_node +  '" might be using a color space (' + cmds.getAttr(file_node + '.colorSpace') + ') that is not appropriate for its connection.')
+            for connection in connections:
+                status_lines.append('   "' + connection + '" triggered this warning.')
+        string_status = format_issue_lines(issues_found, status_lines)
     else: 
         string_status = str(issues_found) + ' issues found. No color space issues were found!'
-    return '\n*** ' + item_name + " ***\n" + string_status
+    return report_section_template.format(item_name, string_status)
 
  
     
 # Checklist Functions End Here ===================================================================
 
 
+# Checklist Functions - Registered once, run in this order by Refresh and Generate Report
+checklist_functions = [ #Removed
+                        check_scene_units,
+                        check_output_resolution,
+                        check_total_texture_count,
+                        check_network_file_paths,
+                        #Removed
+                        check_unparented_objects,
+                        check_total_triangle_count,
+                        check_total_poly_object_count,
+                        #Removed
+                        #Removed - Initial: check_rs_shadow_casting_light_count
+                        #Removed
+                        check_default_object_names,
+                        check_objects_assigned_to_lambert1,
+                        check_ngons,
+                        check_non_manifold_geometry,
+                        #Removed
+                        check_frozen_transforms,
+                        check_animated_visibility,
+                        check_non_deformer_history,
+                        check_textures_color_space,
+                        #Removed
+                      ]
+
+
 def get_short_name(obj):
         '''
         Get the name of the objects without its path (Maya returns full path if name is not unique)
@@ -1737,6 +1682,55 @@ def get_short_name(obj):
 
 
 
+def format_issue_lines(issues_found, status_lines):
+        '''
+        Returns the report text for a check that found issues: the issue count followed by one line per issue
+
+                Parameters:
+                        issues_found (int) - number of issues, used for the count and to pick "issue" or "issues"
+                        status_lines (list) - report lines, one for each object or node with an issue
+        '''
+        issue_string = "issues"
+        if issues_found == 1:
+            issue_string = "issue"
+        return str(issues_found) + ' ' + issue_string + ' found.\n' + '\n'.join(status_lines)
+
+
+
+def list_scene_nodes(node_type, long_names=False):
+        '''
+        Returns all nodes of a type in the scene. While a Refresh or Report is running the result is
+        cached, so checks looking for the same node type (file, mesh, transform) share a single "ls" query.
+        The returned list should not be modified.
+
+                Parameters:
+                        node_type (string) - node type to list, e.g. "mesh"
+                        long_names (bool) - return full DAG paths
+        '''
+        if not checklist_scene_cache.get("is_active"):
+            return cmds.ls(type=node_type, long=long_names) or []
+        cache_key = (node_type, long_names)
+        if cache_key not in checklist_scene_cache.get("nodes"):
+            checklist_scene_cache.get("nodes")[cache_key] = cmds.ls(type=node_type, long=long_names) or []
+        return checklist_scene_cache.get("nodes")[cache_key]
+
+
+
+def set_output_label(item_id, label):
+        '''
+        Update the "Info" text of a checklist item, skipping the edit when it already shows the same label
+
+                Parameters:
+                        item_id (string) - checklist item id (see checklist_item_ids)
+                        label (string, int) - new label for the "output_" text
+        '''
+        label = str(label)
+        if checklist_output_labels.get(item_id) != label:
+            cmds.text("output_" + item_id, e=True, l=label)
+            checklist_output_labels[item_id] = label
+
+
+
 def print_message(message, as_warning=False, as_heads_up_message=False):
     if as_warning:
         cmds.warning(message)
@@ -1748,21 +1742,23 @@ def print_message(message, as_warning=False, as_heads_up_message=False):
                     
 # Used to Export Full Report:
 def export_report_to_txt(list):
-    temp_dir = cmds.internalVar(userTmpDir=True)
-    txt_file = temp_dir+'tmp.txt';
-    
-    f = open(txt_file,'w')
-    
-    output_string = script_name + " Full Report:\n"
-    
-    for obj in list:
-        output_string = output_string + obj + "\n\n"
-    
-    f.write(output_string)
-    f.close()
-
-    notepadCommand = 'exec("notepad ' + txt_file + '");'
-    mel.eval(notepadCommand)
+    txt_file = checklist_report_file.get("path")
+    if txt_file is None:
+        txt_file = cmds.internalVar(userTmpDir=True) + 'tmp.txt'
+        checklist_report_file["path"] = txt_file
+    
+    # Write each section straight into the (buffered) file instead of rebuilding one growing string
+    with open(txt_file,'w') as f:
+        f.write(report_header)
+        for obj in list:
+            f.write(obj)
+            f.write(report_section_separator)
+
+    # Launch the viewer directly (No MEL "exec" and no command shell in between)
+    try:
+        subprocess.Popen(report_viewer_command + [txt_file])
+    except OSError:
+        print_message('Unable to open the report. It was saved to: "' + txt_file + '"', as_warning=True)
 
 
 
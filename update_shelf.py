@@ -2,8 +2,10 @@
 Created by Alexander T. Santiago - github.com/atsantiago
 This script should update the shelf FDMA_2530.
 """
+import filecmp
 import os
 import sys
+import threading
 import urllib.request
 import tempfile
 import maya.cmds as cmds
@@ -15,22 +17,22 @@ import shutil
 repository_url = "https://github.com/Atsantiago/NMSU_Scripts"
 updated_script_path = "shelf_FDMA_2530.mel"
 
-# Check the Maya Python version
-if sys.version_info.major == 2:
-    # Python 2
-    exec_function = execfile
-else:
-    # Python 3
-    exec_function = exec
-
 # Create a temporary directory to download the script
 temp_dir = tempfile.mkdtemp()
 
-# Download the updated shelf script from GitHub
+# Download the updated shelf script from GitHub (In the background, while the user locates the current shelf)
 updated_script_url = f"{repository_url}/raw/master/{updated_script_path}"
 updated_script_file = os.path.join(temp_dir, os.path.basename(updated_script_path))
+download_errors = []
+
+def download_updated_script():
+    try:
+        urllib.request.urlretrieve(updated_script_url, updated_script_file)
+    except OSError as error:
+        download_errors.append(error)
 
-urllib.request.urlretrieve(updated_script_url, updated_script_file)
+download_thread = threading.Thread(target=download_updated_script, daemon=True)
+download_thread.start()
 
 # Prompt the user to locate the current shelf MEL file or cancel the update
 msg_box = QtWidgets.QMessageBox()
@@ -77,12 +79,13 @@ else:
     print("Shelf update operation cancelled.")
     sys.exit(0)  # Exit the script if operation is cancelled
 
-# Compare the downloaded script with the current shelf MEL file
-with open(updated_script_file, "r") as updated_file, open(current_script_file, "r") as current_file:
-    updated_contents = updated_file.read()
-    current_contents = current_file.read()
+# Wait for the download started above (Usually done by the time a file is selected)
+download_thread.join()
+if download_errors:
+    raise download_errors[0]
 
-if updated_contents != current_contents:
+# Compare the downloaded script with the current shelf MEL file (Files with different sizes are never read)
+if not filecmp.cmp(updated_script_file, current_script_file, shallow=False):
     # Create a backup of the existing shelf
     backup_file = current_script_file + ".bak"
     shutil.copy(current_script_file, backup_file)